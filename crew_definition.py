@@ -3,13 +3,197 @@ from crewai import LLM
 from testing.logging_config import get_logger
 from crewai.tools import tool
 from fredapi import Fred
+from functools import lru_cache
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from joblib import Memory
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import urlopen
+import datetime
+import http.client
+import json
 import os
+import tempfile
+import threading
+import time
 from dotenv import load_dotenv
 import pandas as pd
 import numpy as np
+import xml.etree.ElementTree as ET
 
 load_dotenv()
 
+# Years of history downloaded per series; enough for mean/percentile context without the full archive
+_HISTORY_YEARS = 25
+
+_FRED_SEARCH_URL = "https://api.stlouisfed.org/fred/series/search"
+# Seconds before a stalled FRED request is abandoned (surfaces as an OSError in the tools)
+_FRED_TIMEOUT_SECONDS = 15
+
+# Failures from FRED or the network rather than from the request itself: connection errors and timeouts,
+# truncated responses, and non-XML error pages (e.g. a gateway 502) that fredapi fails to parse
+_FRED_UNAVAILABLE_ERRORS = (OSError, http.client.HTTPException, ET.ParseError)
+
+# fredapi calls urlopen without a timeout, so its requests run here and are abandoned after _FRED_TIMEOUT_SECONDS
+_FRED_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="fred")
+
+# Series metadata keyed by series ID, filled from search hits so the data tool can skip get_series_info
+_INFO_CACHE = {}
+_INFO_TTL_SECONDS = 3600
+_INFO_CACHE_MAX_ENTRIES = 512
+_INFO_CACHE_LOCK = threading.Lock()
+
+# Output template for fred_series_info_tool; missing fields render as N/A
+_SERIES_INFO_TMPL = (
+    "Series Information for {series_id}:\n\n"
+    "Title: {title}\n"
+    "Observation Start: {observation_start}\n"
+    "Observation End: {observation_end}\n"
+    "Frequency: {frequency}\n"
+    "Units: {units}\n"
+    "Seasonal Adjustment: {seasonal_adjustment}\n"
+    "Last Updated: {last_updated}\n"
+    "Popularity: {popularity}\n\n"
+    "Notes: {notes}\n\n"
+    "🔗 View on FRED: https://fred.stlouisfed.org/series/{series_id}\n"
+)
+
+# On-disk cache for FRED responses; entries are keyed by calendar day so they expire at midnight.
+# Created lazily next to this module (override with FRED_CACHE_DIR) and pruned once per day, see _today_key()
+_CACHE_DIR = os.getenv("FRED_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".fred_cache"))
+_CACHE_BYTES_LIMIT = "200M"
+_last_pruned_day = None
+
+def _clip(value, n=200, default=''):
+    """
+    Truncate a metadata field to n characters (n=None keeps it whole), falling back to default
+    when it is missing or not a string.
+    """
+    if not isinstance(value, str):
+        return default
+    return value if n is None else value[:n]
+
+def _stats(values):
+    """
+    Statistics kernel for a series' float64 ndarray. Missing observations (NaN) are skipped,
+    as pandas does, but keep their positions so argmin/argmax still index the original dates.
+    Returns (mean, std, min, max, argmin, argmax, count of values below the latest value).
+    """
+    imin = np.nanargmin(values)
+    imax = np.nanargmax(values)
+    valid = np.count_nonzero(~np.isnan(values))
+    std = np.nanstd(values, ddof=1) if valid > 1 else 0.0
+    below = np.count_nonzero(values < values[-1])
+    return np.nanmean(values), std, values[imin], values[imax], imin, imax, below
+
+def _cache_info(series_id, info):
+    """
+    Store series metadata, dropping expired entries and then the oldest ones past _INFO_CACHE_MAX_ENTRIES.
+    Entries are re-inserted on update, so dict order is insertion-time order.
+    """
+    now = time.monotonic()
+    # The multi-series tool inserts from worker threads
+    with _INFO_CACHE_LOCK:
+        _INFO_CACHE.pop(series_id, None)
+        _INFO_CACHE[series_id] = (now, info)
+        for key in list(_INFO_CACHE):
+            if now - _INFO_CACHE[key][0] < _INFO_TTL_SECONDS and len(_INFO_CACHE) <= _INFO_CACHE_MAX_ENTRIES:
+                break
+            del _INFO_CACHE[key]
+
+def _get_series_info(series_id):
+    """
+    Return series metadata from _INFO_CACHE, falling back to a get_series_info call on a miss
+    or once the entry is older than _INFO_TTL_SECONDS.
+    """
+    cached = _INFO_CACHE.get(series_id)
+    if cached and time.monotonic() - cached[0] < _INFO_TTL_SECONDS:
+        return cached[1]
+    info = _cached_info(series_id, _today_key())
+    _cache_info(series_id, info)
+    return info
+
+@lru_cache(maxsize=1)
+def _get_fred():
+    """
+    Return a shared Fred client so repeated tool calls reuse the same instance.
+    """
+    return Fred(api_key=os.environ["FRED_API_KEY"])
+
+def _today_key():
+    """
+    Return today's cache key, pruning the disk cache the first time a new day is seen.
+    Entries from earlier days can never be hit again, so they are evicted by age.
+    """
+    global _last_pruned_day
+    today = datetime.date.today().isoformat()
+    if today != _last_pruned_day:
+        _last_pruned_day = today
+        _get_memory().reduce_size(bytes_limit=_CACHE_BYTES_LIMIT, age_limit=datetime.timedelta(days=1))
+    return today
+
+def _writable_dir(path):
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        return False
+    return os.access(path, os.W_OK)
+
+@lru_cache(maxsize=1)
+def _get_memory():
+    """
+    Build the joblib disk cache on first use, so importing this module never touches the filesystem.
+    Falls back to the system temp dir, then to no caching, when the configured directory is not writable.
+    """
+    for location in (_CACHE_DIR, os.path.join(tempfile.gettempdir(), "fred_cache")):
+        if _writable_dir(location):
+            return Memory(location, verbose=0)
+    return Memory(None, verbose=0)
+
+@lru_cache(maxsize=None)
+def _memoized(func):
+    return _get_memory().cache(func)
+
+def _with_timeout(func, *args, **kwargs):
+    """
+    Run a fredapi call on _FRED_EXECUTOR and raise TimeoutError (an OSError) if it stalls.
+    """
+    try:
+        return _FRED_EXECUTOR.submit(func, *args, **kwargs).result(timeout=_FRED_TIMEOUT_SECONDS)
+    except TimeoutError as e:
+        raise TimeoutError(f"no response from FRED within {_FRED_TIMEOUT_SECONDS} seconds") from e
+
+def _fetch_series(series_id, observation_start, day_key):
+    return _with_timeout(_get_fred().get_series, series_id, observation_start=observation_start)
+
+def _fetch_info(series_id, day_key):
+    return _with_timeout(_get_fred().get_series_info, series_id)
+
+def _cached_series(series_id, observation_start, day_key):
+    return _memoized(_fetch_series)(series_id, observation_start, day_key)
+
+def _cached_info(series_id, day_key):
+    return _memoized(_fetch_info)(series_id, day_key)
+
+def _search_series(query, limit=10):
+    """
+    Query FRED's series/search endpoint as JSON and return the list of series dicts,
+    skipping the DataFrame that fred.search() builds.
+    """
+    params = urlencode({
+        'search_text': query,
+        'limit': limit,
+        'api_key': os.environ["FRED_API_KEY"],
+        'file_type': 'json',
+    })
+    try:
+        with urlopen(f"{_FRED_SEARCH_URL}?{params}", timeout=_FRED_TIMEOUT_SECONDS) as response:
+            return json.load(response).get('seriess', [])
+    except HTTPError as e:
+        # Report rejected requests as ValueError, matching fredapi
+        raise ValueError(f"{e.reason}: {e.read().decode(errors='replace')}") from e
+
 @tool("FRED Search Tool")
 def fred_search_tool(query: str) -> str:
     """
@@ -17,59 +201,60 @@ def fred_search_tool(query: str) -> str:
     Returns series IDs, titles, and descriptions of matching datasets.
     """
     try:
-        fred_api_key = os.getenv("FRED_API_KEY")
-        if not fred_api_key:
+        if not os.environ.get("FRED_API_KEY"):
             return "Error: FRED_API_KEY not found in environment variables. Please add it to your .env file."
         
-        fred = Fred(api_key=fred_api_key)
-        results = fred.search(query, limit=10)
+        results = _search_series(query)
         
-        if results.empty:
+        if not results:
             return f"No results found for query: '{query}'"
         
-        output = f"Found {len(results)} series matching '{query}':\n\n"
-        for idx, (series_id, row) in enumerate(results.iterrows(), 1):
-            output += f"{idx}. {row.get('title', 'N/A')} (ID: {series_id})\n"
-            output += f"   Description: {row.get('notes', 'No description available')[:200]}...\n"
-            output += f"   Frequency: {row.get('frequency_short', 'N/A')} | Units: {row.get('units_short', 'N/A')}\n\n"
+        parts = [f"Found {len(results)} series matching '{query}':\n\n"]
+        for idx, series in enumerate(results, 1):
+            series_id = series['id']
+            _cache_info(series_id, series)
+            parts.append(f"{idx}. {_clip(series.get('title'), n=None, default='N/A')} (ID: {series_id})\n")
+            parts.append(f"   Description: {_clip(series.get('notes'), default='No description available')}...\n")
+            parts.append(f"   Frequency: {_clip(series.get('frequency_short'), n=None, default='N/A')} | Units: {_clip(series.get('units_short'), n=None, default='N/A')}\n\n")
         
-        return output
-    except Exception as e:
+        return "".join(parts)
+    except _FRED_UNAVAILABLE_ERRORS as e:
+        return f"Error searching FRED: FRED API unreachable: {str(e)}"
+    except ValueError as e:
         return f"Error searching FRED: {str(e)}"
 
-@tool("FRED Data Retrieval Tool")
-def fred_data_tool(series_id: str) -> str:
+def _analyze_series(series_id: str) -> str:
     """
-    Retrieve actual economic data from FRED for a specific series ID with comprehensive analysis.
-    Returns recent data points, calculated metrics (MoM, YoY, percentiles), and statistical context.
+    Fetch a single FRED series and build its analysis report.
+    Shared by the single and multi-series data tools.
     """
     try:
-        fred_api_key = os.getenv("FRED_API_KEY")
-        if not fred_api_key:
+        if not os.environ.get("FRED_API_KEY"):
             return "Error: FRED_API_KEY not found in environment variables."
         
-        fred = Fred(api_key=fred_api_key)
+        # Get series info (usually already cached from a preceding search)
+        info = _get_series_info(series_id)
         
-        # Get series info
-        info = fred.get_series_info(series_id)
+        # Get the last _HISTORY_YEARS of data, anchored on the series' latest observation
+        history_start = pd.Timestamp(info['observation_end']) - pd.DateOffset(years=_HISTORY_YEARS)
+        data = _cached_series(series_id, history_start.strftime('%Y-%m-%d'), _today_key())
         
-        # Get complete data history
-        data = fred.get_series(series_id)
-        
-        if data.empty:
+        if data.empty or data.isna().all():
             return f"No data available for series ID: {series_id}"
         
-        # Get recent data points (last 24 for comprehensive analysis - 2 years monthly or 6 years quarterly)
-        recent_data = data.tail(24)
+        # Materialize values and dates once; everything below indexes these directly.
+        # Missing observations stay in place as NaN so the MoM/YoY lookbacks remain positional.
+        arr = data.to_numpy()
+        idx = data.index
         
         # Calculate metrics
-        current_value = data.iloc[-1]
+        current_value = arr[-1]
         
         # MoM change (if monthly or higher frequency)
         mom_change = None
         mom_pct = None
-        if len(data) >= 2:
-            prev_value = data.iloc[-2]
+        if arr.size >= 2:
+            prev_value = arr[-2]
             mom_change = current_value - prev_value
             if prev_value != 0:
                 mom_pct = (mom_change / prev_value) * 100
@@ -79,72 +264,108 @@ def fred_data_tool(series_id: str) -> str:
         yoy_pct = None
         freq = info.get('frequency_short', 'N/A')
         lookback = 12 if freq in ['M', 'Monthly'] else 4 if freq in ['Q', 'Quarterly'] else 1
-        if len(data) >= lookback + 1:
-            year_ago_value = data.iloc[-(lookback + 1)]
+        if arr.size >= lookback + 1:
+            year_ago_value = arr[-(lookback + 1)]
             yoy_change = current_value - year_ago_value
             if year_ago_value != 0:
                 yoy_pct = (yoy_change / year_ago_value) * 100
         
         # Historical statistics
-        mean_value = data.mean()
-        std_value = data.std()
-        min_value = data.min()
-        max_value = data.max()
+        mean_value, std_value, min_value, max_value, trough_pos, peak_pos, below_count = _stats(arr)
         
         # Percentile rank of current value
-        percentile = (data < current_value).sum() / len(data) * 100
+        percentile = below_count / arr.size * 100
         
         # Standard deviations from mean
         std_from_mean = (current_value - mean_value) / std_value if std_value != 0 else 0
         
         # 3-month or 3-period average
-        period_avg = data.tail(3).mean() if len(data) >= 3 else current_value
+        period_avg = np.nanmean(arr[-3:]) if arr.size >= 3 else current_value
         
         # Build comprehensive output with FIXED f-string syntax
-        output = f"=== SERIES ANALYSIS: {info.get('title', series_id)} ===\n\n"
-        output += f"📊 CURRENT DATA:\n"
-        output += f"Series ID: {series_id}\n"
+        parts = [f"=== SERIES ANALYSIS: {info.get('title', series_id)} ===\n\n"]
+        parts.append(f"📊 CURRENT DATA:\n")
+        parts.append(f"Series ID: {series_id}\n")
         # FIXED: Proper f-string syntax
-        output += f"Current Value: {'N/A' if pd.isna(current_value) else f'{current_value:.2f}'}\n"
-        output += f"Date: {data.index[-1].strftime('%Y-%m-%d')}\n"
-        output += f"Frequency: {info.get('frequency', 'N/A')}\n"
-        output += f"Units: {info.get('units', 'N/A')}\n"
-        output += f"Seasonal Adjustment: {info.get('seasonal_adjustment', 'N/A')}\n\n"
+        parts.append(f"Current Value: {'N/A' if pd.isna(current_value) else f'{current_value:.2f}'}\n")
+        parts.append(f"Date: {idx[-1].strftime('%Y-%m-%d')}\n")
+        parts.append(f"Frequency: {info.get('frequency', 'N/A')}\n")
+        parts.append(f"Units: {info.get('units', 'N/A')}\n")
+        parts.append(f"Seasonal Adjustment: {info.get('seasonal_adjustment', 'N/A')}\n\n")
         
-        output += f"📈 CALCULATED METRICS:\n"
+        parts.append(f"📈 CALCULATED METRICS:\n")
         if mom_change is not None:
-            output += f"Month-over-Month Change: {mom_change:+.2f} ({mom_pct:+.2f}%)\n"
+            parts.append(f"Month-over-Month Change: {mom_change:+.2f} ({mom_pct:+.2f}%)\n")
         if yoy_change is not None:
-            output += f"Year-over-Year Change: {yoy_change:+.2f} ({yoy_pct:+.2f}%)\n"
-        output += f"3-Period Average: {period_avg:.2f}\n\n"
+            parts.append(f"Year-over-Year Change: {yoy_change:+.2f} ({yoy_pct:+.2f}%)\n")
+        parts.append(f"3-Period Average: {period_avg:.2f}\n\n")
         
-        output += f"📉 HISTORICAL CONTEXT:\n"
-        output += f"Historical Mean: {mean_value:.2f}\n"
-        output += f"Standard Deviation: {std_value:.2f}\n"
-        output += f"Historical Range: {min_value:.2f} to {max_value:.2f}\n"
-        output += f"Current Percentile Rank: {percentile:.1f}th percentile\n"
-        output += f"Distance from Mean: {std_from_mean:+.2f} standard deviations\n"
-        output += f"Data Range: {data.index[0].strftime('%Y-%m-%d')} to {data.index[-1].strftime('%Y-%m-%d')}\n"
-        output += f"Total Observations: {len(data)}\n\n"
+        parts.append(f"📉 HISTORICAL CONTEXT (last {_HISTORY_YEARS} years):\n")
+        parts.append(f"Historical Mean: {mean_value:.2f}\n")
+        parts.append(f"Standard Deviation: {std_value:.2f}\n")
+        parts.append(f"Historical Range: {min_value:.2f} to {max_value:.2f}\n")
+        parts.append(f"Current Percentile Rank: {percentile:.1f}th percentile\n")
+        parts.append(f"Distance from Mean: {std_from_mean:+.2f} standard deviations\n")
+        parts.append(f"Data Range: {idx[0].strftime('%Y-%m-%d')} to {idx[-1].strftime('%Y-%m-%d')}\n")
+        parts.append(f"Total Observations: {len(data)}\n\n")
         
-        output += f"📋 RECENT DATA POINTS (Last 15):\n"
-        for date, value in recent_data.tail(15).items():
-            output += f"  {date.strftime('%Y-%m-%d')}: {value:.2f}\n"
+        parts.append(f"📋 RECENT DATA POINTS (Last 15):\n")
+        recent_dates = np.asarray(idx[-15:].strftime('%Y-%m-%d'), dtype=str)
+        recent_values = np.char.mod('%.2f', arr[-15:])
+        recent_lines = np.char.add(np.char.add("  ", recent_dates), np.char.add(": ", recent_values))
+        parts.append("\n".join(recent_lines) + "\n")
         
-        # Add summary of full dataset
-        output += f"\n📊 FULL DATASET SUMMARY:\n"
-        output += f"Total data points retrieved: {len(data)}\n"
-        output += f"Oldest data: {data.index[0].strftime('%Y-%m-%d')} = {data.iloc[0]:.2f}\n"
-        output += f"Newest data: {data.index[-1].strftime('%Y-%m-%d')} = {data.iloc[-1]:.2f}\n"
-        output += f"Average over entire period: {mean_value:.2f}\n"
-        output += f"Peak value: {max_value:.2f} on {data.idxmax().strftime('%Y-%m-%d')}\n"
-        output += f"Trough value: {min_value:.2f} on {data.idxmin().strftime('%Y-%m-%d')}\n"
+        # Add summary of retrieved dataset
+        parts.append(f"\n📊 DATASET SUMMARY (last {_HISTORY_YEARS} years):\n")
+        parts.append(f"Total data points retrieved: {len(data)}\n")
+        parts.append(f"Series available since: {pd.Timestamp(info['observation_start']).strftime('%Y-%m-%d')}\n")
+        parts.append(f"Oldest data: {idx[0].strftime('%Y-%m-%d')} = {arr[0]:.2f}\n")
+        parts.append(f"Newest data: {idx[-1].strftime('%Y-%m-%d')} = {current_value:.2f}\n")
+        parts.append(f"Average over last {_HISTORY_YEARS} years: {mean_value:.2f}\n")
+        parts.append(f"Peak value: {max_value:.2f} on {idx[peak_pos].strftime('%Y-%m-%d')}\n")
+        parts.append(f"Trough value: {min_value:.2f} on {idx[trough_pos].strftime('%Y-%m-%d')}\n")
         
-        output += f"\n🔗 View on FRED: https://fred.stlouisfed.org/series/{series_id}\n"
+        parts.append(f"\n🔗 View on FRED: https://fred.stlouisfed.org/series/{series_id}\n")
         
-        return output
-    except Exception as e:
-        return f"Error retrieving data for {series_id}: {str(e)}"
+        return "".join(parts)
+    except _FRED_UNAVAILABLE_ERRORS as e:
+        return f"Error retrieving data for {series_id}: FRED API unreachable: {str(e)}"
+    except ValueError as e:
+        return f"Error retrieving data for {series_id}: series not found or request rejected: {str(e)}"
+    except KeyError as e:
+        return f"Error retrieving data for {series_id}: missing metadata field {str(e)}"
+
+@tool("FRED Data Retrieval Tool")
+def fred_data_tool(series_id: str) -> str:
+    """
+    Retrieve actual economic data from FRED for a specific series ID with comprehensive analysis.
+    Returns recent data points, calculated metrics (MoM, YoY, percentiles), and statistical context.
+    """
+    return _analyze_series(series_id)
+
+@tool("FRED Multi-Series Data Tool")
+def fred_data_multi_tool(series_ids: str) -> str:
+    """
+    Retrieve and analyze several FRED series at once from a comma-separated list of series IDs
+    (e.g. "UNRATE,CPIAUCSL,GDP"). Series are fetched concurrently and each returns the same
+    analysis as the FRED Data Retrieval Tool.
+    """
+    ids = [s.strip() for s in series_ids.split(",") if s.strip()]
+    if not ids:
+        return "Error: No series IDs provided. Pass a comma-separated list such as \"UNRATE,CPIAUCSL\"."
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(ids))) as executor:
+        futures = [executor.submit(_analyze_series, series_id) for series_id in ids]
+    
+    # Collect each series separately so one failure cannot discard the rest of the batch
+    results = []
+    for series_id, future in zip(ids, futures):
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(f"Error retrieving data for {series_id}: {str(e)}")
+    
+    return "\n\n".join(results)
 
 @tool("FRED Series Info Tool")
 def fred_series_info_tool(series_id: str) -> str:
@@ -152,29 +373,123 @@ def fred_series_info_tool(series_id: str) -> str:
     Get detailed information about a FRED data series including metadata and source information.
     """
     try:
-        fred_api_key = os.getenv("FRED_API_KEY")
-        if not fred_api_key:
+        if not os.environ.get("FRED_API_KEY"):
             return "Error: FRED_API_KEY not found in environment variables."
         
-        fred = Fred(api_key=fred_api_key)
-        info = fred.get_series_info(series_id)
+        info = _cached_info(series_id, _today_key())
         
-        output = f"Series Information for {series_id}:\n\n"
-        output += f"Title: {info.get('title', 'N/A')}\n"
-        output += f"Observation Start: {info.get('observation_start', 'N/A')}\n"
-        output += f"Observation End: {info.get('observation_end', 'N/A')}\n"
-        output += f"Frequency: {info.get('frequency', 'N/A')}\n"
-        output += f"Units: {info.get('units', 'N/A')}\n"
-        output += f"Seasonal Adjustment: {info.get('seasonal_adjustment', 'N/A')}\n"
-        output += f"Last Updated: {info.get('last_updated', 'N/A')}\n"
-        output += f"Popularity: {info.get('popularity', 'N/A')}\n\n"
-        output += f"Notes: {info.get('notes', 'No notes available')}\n\n"
-        output += f"🔗 View on FRED: https://fred.stlouisfed.org/series/{series_id}\n"
+        fields = defaultdict(lambda: 'N/A', info)
+        fields.setdefault('notes', 'No notes available')
+        fields['series_id'] = series_id
         
-        return output
-    except Exception as e:
-        return f"Error getting info for {series_id}: {str(e)}"
+        return _SERIES_INFO_TMPL.format_map(fields)
+    except _FRED_UNAVAILABLE_ERRORS as e:
+        return f"Error getting info for {series_id}: FRED API unreachable: {str(e)}"
+    except ValueError as e:
+        return f"Error getting info for {series_id}: series not found or request rejected: {str(e)}"
+
+# Undecorated tool functions for direct, non-LLM callers (e.g. the CLI fast path) - skips CrewAI's per-call input validation
+fred_search = fred_search_tool.func
+fred_data = fred_data_tool.func
+fred_data_multi = fred_data_multi_tool.func
+fred_series_info = fred_series_info_tool.func
+
+# Task prompts, defined once at import; CrewAI fills in {text} at kickoff
+_ANALYST_TASK_TMPL = """Analyze this economic data query and retrieve ALL relevant data: {text}
+                    
+                    CRITICAL REQUIREMENTS:
+                    1. Identify EVERY economic indicator mentioned in the query
+                    2. If the query asks for multiple metrics (e.g., "compare A, B, and C"), retrieve ALL of them
+                    3. If the query mentions specific time periods (e.g., "2008 crisis"), retrieve data from that period
+                    4. Use fred_data_tool to get actual data with calculations - don't just search
+                    5. Retrieve enough historical data to provide meaningful context
+                    6. If a tool fails 2-3 times, try alternative series IDs or report the issue
+                    
+                    STEPS:
+                    1. Use fred_search_tool with a single string query parameter. Example: fred_search_tool("unemployment rate")
+                    2. Find the relevant series ID from the search results
+                    3. Use fred_data_tool with a single string series_id parameter. Example: fred_data_tool("UNRATE")
+                    4. When 2 or more series are needed, prefer fred_data_multi_tool with ONE comma-separated string. Example: fred_data_multi_tool("UNRATE,CPIAUCSL,GDP")
+                    5. NEVER pass JSON arrays or multiple parameters - ALWAYS use single string arguments
+                    6. Verify you've retrieved data for EVERY part of the query
+                    
+                    EARLY EXIT CONDITIONS (Stop immediately and report):
+                    - If FRED search returns NO results for the query
+                    - If all data retrieval attempts fail
+                    - If the query appears to be outside FRED's scope (non-economic)
+                    - If no relevant economic indicators can be identified
+                    
+                    FORBIDDEN:
+                    - Never provide search results without retrieving actual data
+                    - Never answer only part of a multi-part question
+                    - Never skip historical periods specifically mentioned
+                    - Never retry the same failing tool more than 3 times
+                    - Never fabricate data when retrieval fails
+                    """
 
+_ANALYST_TASK_OUTPUT = """Complete data retrieval including:
+                    - Actual data values for ALL series mentioned in query
+                    - Calculated metrics (MoM, YoY, percentiles) for each series
+                    - Historical context data if requested
+                    - All series metadata and FRED links
+                    - Clear indication if any data retrieval failed
+                    - If NO data found: explicit message stating data is unavailable with suggestions"""
+
+_ADVISOR_TASK_TMPL = """Transform the retrieved FRED data into a comprehensive, actionable analysis.
+                    
+                    REQUIRED STRUCTURE (BE CONCISE):
+                    
+                    ## 🏠 INTRODUCTION
+                    - User's original request: {text}
+                    - Brief 1-2 sentence summary of what economic data was analyzed
+                    - Data source and time period covered
+                    
+                    ## 📊 EXECUTIVE SUMMARY
+                    - 3-5 bullet points with key findings
+                    - Current values and most important changes
+                    - One-line historical context (e.g., "highest since 2008")
+                    
+                    ## 📈 DETAILED DATA ANALYSIS
+                    - Show current value, changes (MoM/YoY), and percentile rank
+                    - Recent data table (last 10 periods) with VALUES ONLY (exclude N/A)
+                    - Brief trend description
+                    - Historical summary statistics (mean, min, max)
+                    
+                    ## 🔍 HISTORICAL CONTEXT
+                    - Is current value high/low relative to historical norms?
+                    - Statistical significance (standard deviations from mean)
+                    
+                    ## 💡 WHAT THIS MEANS
+                    - Economic implications (1-2 sentences)
+                    - Policy implications (1-2 sentences)
+                    - Market implications (1-2 sentences)
+                    
+                    ## 🔗 FURTHER EXPLORATION
+                    - Direct FRED link for the series
+                    - 2-3 related indicators to explore
+                    
+                    CRITICAL REQUIREMENTS:
+                    1. NEVER ask follow-up questions - provide a complete, final answer
+                    2. Exclude N/A values from all output - only show calculated metrics with real data
+                    3. Keep INTRODUCTION concise - 2-3 sentences max
+                    4. Use specific numbers from actual data retrieved
+                    5. Make your best interpretation and provide complete analysis
+                    
+                    FORBIDDEN:
+                    - Never ask "Would you like me to..."
+                    - Never say "If you'd like, I can..."
+                    - Never include N/A in data tables or output
+                    - Never leave analysis incomplete
+                    - Never provide generic boilerplate"""
+
+_ADVISOR_TASK_OUTPUT = """Concise economic analysis with:
+                    - Introduction showing user's request and brief analysis overview
+                    - Executive summary with 3-5 key findings
+                    - Detailed data with current values, changes, and recent data table (NO N/A values)
+                    - Historical context with statistical significance
+                    - Brief implications for economy, policy, and markets
+                    - FRED links for further exploration
+                    - Complete final answer with no follow-up questions"""
 
 class FREDEconomicCrew:
     """
@@ -195,6 +510,15 @@ class FREDEconomicCrew:
         self.crew = self.create_crew()
         self.logger.info("FRED Economic Crew initialized")
 
+    @classmethod
+    @lru_cache(maxsize=8)
+    def get(cls, model=None, temperature=None, verbose=True, logger=None):
+        """
+        Return a shared crew for the given configuration, building it on first use.
+        Reusing the crew avoids re-initializing the LLM client and agents on every query.
+        """
+        return cls(verbose=verbose, logger=logger, model=model, temperature=temperature)
+
     def create_crew(self):
         self.logger.info("Creating FRED economic data crew")
         
@@ -212,13 +536,14 @@ class FREDEconomicCrew:
             CRITICAL GUARDRAILS:
             - ALWAYS call tools with single string parameters. Example: fred_search_tool("unemployment rate") NOT fred_search_tool(["query": "unemployment rate"])
             - NEVER pass JSON arrays or multiple parameters to tools - use single string arguments only
+            - When you need 2 or more series, use fred_data_multi_tool with one comma-separated string. Example: fred_data_multi_tool("UNRATE,CPIAUCSL")
             - If a tool fails 2-3 times, try a different series ID or inform the user about the issue.
             - If FRED search returns NO results or empty data, you MUST immediately inform the user that 
               the requested data is not available in FRED. DO NOT make up data or provide generic responses.
             - You ONLY work with Federal Reserve Economic Data. If a query is clearly outside economics 
               (e.g., weather, recipes, entertainment), politely inform the user this is outside your scope.
             - Never hallucinate data. If you cannot retrieve actual data, say so explicitly.""",
-            tools=[fred_search_tool, fred_data_tool, fred_series_info_tool],
+            tools=[fred_search_tool, fred_data_tool, fred_data_multi_tool, fred_series_info_tool],
             llm=self.llm,
             verbose=self.verbose
         )
@@ -267,103 +592,19 @@ class FREDEconomicCrew:
             agents=[fred_analyst, economic_advisor],
             tasks=[
                 Task(
-                    description="""Analyze this economic data query and retrieve ALL relevant data: {text}
-                    
-                    CRITICAL REQUIREMENTS:
-                    1. Identify EVERY economic indicator mentioned in the query
-                    2. If the query asks for multiple metrics (e.g., "compare A, B, and C"), retrieve ALL of them
-                    3. If the query mentions specific time periods (e.g., "2008 crisis"), retrieve data from that period
-                    4. Use fred_data_tool to get actual data with calculations - don't just search
-                    5. Retrieve enough historical data to provide meaningful context
-                    6. If a tool fails 2-3 times, try alternative series IDs or report the issue
-                    
-                    STEPS:
-                    1. Use fred_search_tool with a single string query parameter. Example: fred_search_tool("unemployment rate")
-                    2. Find the relevant series ID from the search results
-                    3. Use fred_data_tool with a single string series_id parameter. Example: fred_data_tool("UNRATE")
-                    4. NEVER pass JSON arrays or multiple parameters - ALWAYS use single string arguments
-                    5. Verify you've retrieved data for EVERY part of the query
-                    
-                    EARLY EXIT CONDITIONS (Stop immediately and report):
-                    - If FRED search returns NO results for the query
-                    - If all data retrieval attempts fail
-                    - If the query appears to be outside FRED's scope (non-economic)
-                    - If no relevant economic indicators can be identified
-                    
-                    FORBIDDEN:
-                    - Never provide search results without retrieving actual data
-                    - Never answer only part of a multi-part question
-                    - Never skip historical periods specifically mentioned
-                    - Never retry the same failing tool more than 3 times
-                    - Never fabricate data when retrieval fails
-                    """,
-                    expected_output="""Complete data retrieval including:
-                    - Actual data values for ALL series mentioned in query
-                    - Calculated metrics (MoM, YoY, percentiles) for each series
-                    - Historical context data if requested
-                    - All series metadata and FRED links
-                    - Clear indication if any data retrieval failed
-                    - If NO data found: explicit message stating data is unavailable with suggestions""",
+                    description=_ANALYST_TASK_TMPL,
+                    expected_output=_ANALYST_TASK_OUTPUT,
                     agent=fred_analyst
                 ),
                 Task(
-                    description="""Transform the retrieved FRED data into a comprehensive, actionable analysis.
-                    
-                    REQUIRED STRUCTURE (BE CONCISE):
-                    
-                    ## 🏠 INTRODUCTION
-                    - User's original request: {text}
-                    - Brief 1-2 sentence summary of what economic data was analyzed
-                    - Data source and time period covered
-                    
-                    ## 📊 EXECUTIVE SUMMARY
-                    - 3-5 bullet points with key findings
-                    - Current values and most important changes
-                    - One-line historical context (e.g., "highest since 2008")
-                    
-                    ## 📈 DETAILED DATA ANALYSIS
-                    - Show current value, changes (MoM/YoY), and percentile rank
-                    - Recent data table (last 10 periods) with VALUES ONLY (exclude N/A)
-                    - Brief trend description
-                    - Historical summary statistics (mean, min, max)
-                    
-                    ## 🔍 HISTORICAL CONTEXT
-                    - Is current value high/low relative to historical norms?
-                    - Statistical significance (standard deviations from mean)
-                    
-                    ## 💡 WHAT THIS MEANS
-                    - Economic implications (1-2 sentences)
-                    - Policy implications (1-2 sentences)
-                    - Market implications (1-2 sentences)
-                    
-                    ## 🔗 FURTHER EXPLORATION
-                    - Direct FRED link for the series
-                    - 2-3 related indicators to explore
-                    
-                    CRITICAL REQUIREMENTS:
-                    1. NEVER ask follow-up questions - provide a complete, final answer
-                    2. Exclude N/A values from all output - only show calculated metrics with real data
-                    3. Keep INTRODUCTION concise - 2-3 sentences max
-                    4. Use specific numbers from actual data retrieved
-                    5. Make your best interpretation and provide complete analysis
-                    
-                    FORBIDDEN:
-                    - Never ask "Would you like me to..."
-                    - Never say "If you'd like, I can..."
-                    - Never include N/A in data tables or output
-                    - Never leave analysis incomplete
-                    - Never provide generic boilerplate""",
-                    expected_output="""Concise economic analysis with:
-                    - Introduction showing user's request and brief analysis overview
-                    - Executive summary with 3-5 key findings
-                    - Detailed data with current values, changes, and recent data table (NO N/A values)
-                    - Historical context with statistical significance
-                    - Brief implications for economy, policy, and markets
-                    - FRED links for further exploration
-                    - Complete final answer with no follow-up questions""",
+                    description=_ADVISOR_TASK_TMPL,
+                    expected_output=_ADVISOR_TASK_OUTPUT,
                     agent=economic_advisor
                 )
             ],
+            # The crew is shared for the whole process (see get()), so CrewAI's tool-result cache would
+            # never expire; FRED freshness is handled by _INFO_CACHE and the day-keyed disk cache instead
+            cache=False,
             verbose=True
         )
         
@@ -80,7 +80,7 @@ class ProvideInputRequest(BaseModel):
 async def execute_crew_task(input_data: str) -> str:
     """ Execute a CrewAI task with FRED Economic Data Agents """
     logger.info(f"Starting FRED Economic Data query with input: {input_data}")
-    crew = FREDEconomicCrew(logger=logger)
+    crew = FREDEconomicCrew.get(logger=logger)
     result = crew.crew.kickoff(inputs={"text": input_data})
     logger.info("FRED Economic Data query completed successfully")
     return result
@@ -390,7 +390,7 @@ def test_standalone():
     print("="*80 + "\n")
     
     input_data = {"text": "What is the current unemployment rate in the United States?"}
-    crew = FREDEconomicCrew()
+    crew = FREDEconomicCrew.get()
     result = crew.crew.kickoff(input_data)
     
     print("\n" + "="*80)
@@ -2,10 +2,22 @@
 """
 Quick CLI test for FREDagent with custom prompts
 Usage: python test_custom.py "Your query here"
+       python test_custom.py --fast "search terms"     (FRED search only, no LLM)
+       python test_custom.py --series UNRATE,CPIAUCSL  (series analysis only, no LLM)
 """
 
 import sys
-from crew_definition import FREDEconomicCrew
+from crew_definition import FREDEconomicCrew, fred_search, fred_data_multi
+
+def run_fast(mode, arg):
+    """Call the FRED tool functions directly, bypassing the crew and the LLM."""
+    print("\n" + "="*80)
+    print("⚡ FRED Economic Data Agent - Fast Mode")
+    print("="*80 + "\n")
+    if mode == "--fast":
+        print(fred_search(arg))
+    else:
+        print(fred_data_multi(arg))
 
 def main():
     if len(sys.argv) < 2:
@@ -17,9 +29,16 @@ def main():
         print('  python test_custom.py "What is the current unemployment rate?"')
         print('  python test_custom.py "Show me GDP growth over the last 2 years"')
         print('  python test_custom.py "What is the federal funds rate?"')
+        print('  python test_custom.py --fast "unemployment rate"')
+        print('  python test_custom.py --series UNRATE,CPIAUCSL')
         print("\n" + "="*80 + "\n")
         sys.exit(1)
     
+    # Simple lookups skip the crew entirely
+    if sys.argv[1] in ("--fast", "--series") and len(sys.argv) > 2:
+        run_fast(sys.argv[1], ' '.join(sys.argv[2:]))
+        return
+    
     # Get the query from command line arguments
     query = ' '.join(sys.argv[1:])
     
@@ -32,7 +51,7 @@ def main():
     
     try:
         # Initialize and run the crew
-        crew = FREDEconomicCrew()
+        crew = FREDEconomicCrew.get()
         result = crew.crew.kickoff({"text": query})
         
         print("\n" + "="*80)
@@ -51,7 +51,7 @@ def test_query(query: str, test_name=None):
     
     try:
         input_data = {"text": query}
-        crew = FREDEconomicCrew()
+        crew = FREDEconomicCrew.get()
         result = crew.crew.kickoff(input_data)
         
         print("\n" + "="*80)